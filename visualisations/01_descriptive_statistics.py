@@ -11,94 +11,113 @@ import seaborn as sns
 sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (14, 10)
 
-# Create sample data similar to the notebook
-np.random.seed(42)
-data = pd.DataFrame({
-    'column_A': np.random.normal(50, 15, 1000),
-    'column_B': np.random.exponential(20, 1000),
-    'column_C': np.random.uniform(0, 100, 1000)
-})
-
-# Create figure with subplots
-fig, axes = plt.subplots(3, 2, figsize=(14, 12))
-fig.suptitle('Descriptive Statistics Visualizations', fontsize=16, fontweight='bold')
-
-columns = ['column_A', 'column_B', 'column_C']
-titles = ['Normal Distribution', 'Exponential Distribution', 'Uniform Distribution']
-
-for idx, (col, title) in enumerate(zip(columns, titles)):
-    # Get statistics
-    stats = data[col].describe()
-
-    # Histogram
-    ax1 = axes[idx, 0]
-    ax1.hist(data[col], bins=30, alpha=0.7, color='skyblue', edgecolor='black')
-    ax1.axvline(stats['mean'], color='red', linestyle='--', linewidth=2, label=f"Mean: {stats['mean']:.2f}")
-    ax1.axvline(stats['50%'], color='green', linestyle='--', linewidth=2, label=f"Median: {stats['50%']:.2f}")
-    ax1.axvline(stats['mean'] + stats['std'], color='orange', linestyle=':', linewidth=2, label=f"±1 Std: {stats['std']:.2f}")
-    ax1.axvline(stats['mean'] - stats['std'], color='orange', linestyle=':', linewidth=2)
-    ax1.set_title(f'{title} - Histogram')
-    ax1.set_xlabel('Value')
-    ax1.set_ylabel('Frequency')
-    ax1.legend()
-    ax1.grid(True, alpha=0.3)
-
-    # Box plot
-    ax2 = axes[idx, 1]
-    bp = ax2.boxplot(data[col], vert=True, patch_artist=True,
-                     labels=[col],
+
+def main():
+    """Generate and save the descriptive statistics figures"""
+    # Create sample data similar to the notebook
+    rng = np.random.default_rng(42)
+    data = pd.DataFrame({
+        'column_A': rng.normal(50, 15, 1000),
+        'column_B': rng.exponential(20, 1000),
+        'column_C': rng.uniform(0, 100, 1000)
+    })
+
+    # Create figure with subplots
+    fig, axes = plt.subplots(3, 2, figsize=(14, 12))
+    fig.suptitle('Descriptive Statistics Visualizations', fontsize=16, fontweight='bold')
+
+    columns = ['column_A', 'column_B', 'column_C']
+    titles = ['Normal Distribution', 'Exponential Distribution', 'Uniform Distribution']
+
+    # Compute describe() once and reuse it for the plots and the summary table
+    desc = data.describe()
+
+    for idx, (col, title) in enumerate(zip(columns, titles)):
+        # Get statistics
+        stats = desc[col]
+
+        # Histogram
+        ax1 = axes[idx, 0]
+        ax1.hist(data[col], bins=30, alpha=0.7, color='skyblue', edgecolor='black')
+        ax1.axvline(stats['mean'], color='red', linestyle='--', linewidth=2, label=f"Mean: {stats['mean']:.2f}")
+        ax1.axvline(stats['50%'], color='green', linestyle='--', linewidth=2, label=f"Median: {stats['50%']:.2f}")
+        ax1.axvline(stats['mean'] + stats['std'], color='orange', linestyle=':', linewidth=2, label=f"±1 Std: {stats['std']:.2f}")
+        ax1.axvline(stats['mean'] - stats['std'], color='orange', linestyle=':', linewidth=2)
+        ax1.set_title(f'{title} - Histogram')
+        ax1.set_xlabel('Value')
+        ax1.set_ylabel('Frequency')
+        ax1.legend()
+        ax1.grid(True, alpha=0.3)
+
+        # Box plot
+        # Reuse the describe() quartiles and sort once for the whiskers and fliers,
+        # so Matplotlib does not recompute the percentiles
+        ax2 = axes[idx, 1]
+        sorted_vals = np.sort(data[col].to_numpy())
+        q1, med, q3 = stats['25%'], stats['50%'], stats['75%']
+        iqr = q3 - q1
+        whislo = sorted_vals[np.searchsorted(sorted_vals, q1 - 1.5 * iqr)]
+        whishi = sorted_vals[np.searchsorted(sorted_vals, q3 + 1.5 * iqr, side='right') - 1]
+        box_stats = [{'label': col, 'q1': q1, 'med': med, 'q3': q3,
+                      'whislo': whislo, 'whishi': whishi,
+                      'fliers': sorted_vals[(sorted_vals < whislo) | (sorted_vals > whishi)]}]
+        bp = ax2.bxp(box_stats, vert=True, patch_artist=True,
                      boxprops=dict(facecolor='lightblue', alpha=0.7),
                      medianprops=dict(color='red', linewidth=2),
                      whiskerprops=dict(linewidth=1.5),
                      capprops=dict(linewidth=1.5))
 
-    # Annotate key statistics
-    ax2.text(1.3, stats['25%'], f"Q1: {stats['25%']:.2f}", fontsize=9, va='center')
-    ax2.text(1.3, stats['50%'], f"Median: {stats['50%']:.2f}", fontsize=9, va='center', color='red', fontweight='bold')
-    ax2.text(1.3, stats['75%'], f"Q3: {stats['75%']:.2f}", fontsize=9, va='center')
-    ax2.text(1.3, stats['min'], f"Min: {stats['min']:.2f}", fontsize=9, va='center')
-    ax2.text(1.3, stats['max'], f"Max: {stats['max']:.2f}", fontsize=9, va='center')
-
-    ax2.set_title(f'{title} - Box Plot')
-    ax2.set_ylabel('Value')
-    ax2.grid(True, alpha=0.3, axis='y')
-
-plt.tight_layout()
-plt.savefig('/Users/jawad/Documents/work/dsai/5m-data-1.8-eda-basic/illustrations/01_descriptive_statistics.png',
-            dpi=300, bbox_inches='tight')
-print("Saved: 01_descriptive_statistics.png")
-
-# Create a summary table visualization
-fig, ax = plt.subplots(figsize=(10, 6))
-ax.axis('tight')
-ax.axis('off')
-
-# Get describe output
-desc_table = data.describe().T
-desc_table = desc_table.round(2)
-
-table = ax.table(cellText=desc_table.values,
-                colLabels=desc_table.columns,
-                rowLabels=desc_table.index,
-                cellLoc='center',
-                loc='center',
-                colWidths=[0.12] * len(desc_table.columns))
-
-table.auto_set_font_size(False)
-table.set_fontsize(10)
-table.scale(1, 2)
-
-# Style the header
-for i in range(len(desc_table.columns)):
-    table[(0, i)].set_facecolor('#4CAF50')
-    table[(0, i)].set_text_props(weight='bold', color='white')
-
-# Style the row headers
-for i in range(len(desc_table.index)):
-    table[(i+1, -1)].set_facecolor('#E8F5E9')
-    table[(i+1, -1)].set_text_props(weight='bold')
-
-plt.title('DataFrame.describe() Output', fontsize=14, fontweight='bold', pad=20)
-plt.savefig('/Users/jawad/Documents/work/dsai/5m-data-1.8-eda-basic/illustrations/01_descriptive_statistics_table.png',
-            dpi=300, bbox_inches='tight')
-print("Saved: 01_descriptive_statistics_table.png")
+        # Annotate key statistics
+        ax2.text(1.3, stats['25%'], f"Q1: {stats['25%']:.2f}", fontsize=9, va='center')
+        ax2.text(1.3, stats['50%'], f"Median: {stats['50%']:.2f}", fontsize=9, va='center', color='red', fontweight='bold')
+        ax2.text(1.3, stats['75%'], f"Q3: {stats['75%']:.2f}", fontsize=9, va='center')
+        ax2.text(1.3, stats['min'], f"Min: {stats['min']:.2f}", fontsize=9, va='center')
+        ax2.text(1.3, stats['max'], f"Max: {stats['max']:.2f}", fontsize=9, va='center')
+
+        ax2.set_title(f'{title} - Box Plot')
+        ax2.set_ylabel('Value')
+        ax2.grid(True, alpha=0.3, axis='y')
+
+    plt.tight_layout()
+    plt.savefig('/Users/jawad/Documents/work/dsai/5m-data-1.8-eda-basic/illustrations/01_descriptive_statistics.png',
+                dpi=150, bbox_inches='tight')
+    print("Saved: 01_descriptive_statistics.png")
+    plt.close(fig)
+
+    # Create a summary table visualization
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.axis('tight')
+    ax.axis('off')
+
+    # Get describe output
+    desc_table = desc.T.round(2)
+
+    table = ax.table(cellText=desc_table.values,
+                    colLabels=desc_table.columns,
+                    rowLabels=desc_table.index,
+                    cellLoc='center',
+                    loc='center',
+                    colWidths=[0.12] * len(desc_table.columns))
+
+    table.auto_set_font_size(False)
+    table.set_fontsize(10)
+    table.scale(1, 2)
+
+    # Style the header and the row headers in a single pass over the cells
+    for (row, col), cell in table.get_celld().items():
+        if row == 0:
+            cell.set_facecolor('#4CAF50')
+            cell.set_text_props(weight='bold', color='white')
+        elif col == -1:
+            cell.set_facecolor('#E8F5E9')
+            cell.set_text_props(weight='bold')
+
+    plt.title('DataFrame.describe() Output', fontsize=14, fontweight='bold', pad=20)
+    plt.savefig('/Users/jawad/Documents/work/dsai/5m-data-1.8-eda-basic/illustrations/01_descriptive_statistics_table.png',
+                dpi=150, bbox_inches='tight')
+    print("Saved: 01_descriptive_statistics_table.png")
+    plt.close(fig)
+
+
+if __name__ == '__main__':
+    main()
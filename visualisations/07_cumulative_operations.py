@@ -4,6 +4,8 @@ Shows cumsum, cumprod, cummax, cummin and other accumulation methods
 """
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # scripts only save to file, so skip loading a GUI backend
 import matplotlib.pyplot as plt
 import seaborn as sns
 
@@ -19,10 +21,12 @@ df = pd.DataFrame({
     'daily_change': daily_values
 })
 
-df['cumsum'] = df['daily_change'].cumsum()
-df['cummax'] = df['daily_change'].cummax()
-df['cummin'] = df['daily_change'].cummin()
-df['cumprod'] = (1 + df['daily_change']/100).cumprod()
+# Same results as Series.cumsum()/cummax()/cummin()/cumprod(), computed on the
+# raw array (the data has no NaNs, so pandas' NaN handling is not needed)
+df['cumsum'] = np.cumsum(daily_values)
+df['cummax'] = np.maximum.accumulate(daily_values)
+df['cummin'] = np.minimum.accumulate(daily_values)
+df['cumprod'] = np.cumprod(1 + daily_values / 100.0)
 
 # Create figure with subplots
 fig = plt.figure(figsize=(16, 12))
@@ -42,10 +46,9 @@ ax1.set_ylabel('Value')
 ax1.legend()
 ax1.grid(True, alpha=0.3)
 ax1.axhline(0, color='black', linewidth=0.8)
-ax1.tick_params(axis='x', rotation=45)
 
 # 2. Cumulative Sum Line
-ax2 = fig.add_subplot(gs[0, 1])
+ax2 = fig.add_subplot(gs[0, 1], sharex=ax1)
 ax2.plot(df['date'], df['cumsum'], marker='o', markersize=4,
         linewidth=2, color='#2196F3', label='Cumulative Sum')
 ax2.fill_between(df['date'], 0, df['cumsum'], alpha=0.3, color='#2196F3')
@@ -55,7 +58,6 @@ ax2.set_ylabel('Cumulative Sum')
 ax2.legend()
 ax2.grid(True, alpha=0.3)
 ax2.axhline(0, color='black', linewidth=0.8)
-ax2.tick_params(axis='x', rotation=45)
 
 # Add annotations for key points
 max_idx = df['cumsum'].idxmax()
@@ -69,7 +71,7 @@ ax2.annotate(f'Peak: {df.loc[max_idx, "cumsum"]:.0f}',
             arrowprops=dict(arrowstyle='->', color='green'))
 
 # 3. Cumulative Max and Min
-ax3 = fig.add_subplot(gs[1, 0])
+ax3 = fig.add_subplot(gs[1, 0], sharex=ax1)
 ax3.plot(df['date'], df['daily_change'], marker='o', markersize=3,
         alpha=0.4, label='Daily Change', color='gray', linewidth=1)
 ax3.plot(df['date'], df['cummax'], marker='s', markersize=4,
@@ -81,22 +83,17 @@ ax3.set_xlabel('Date')
 ax3.set_ylabel('Value')
 ax3.legend()
 ax3.grid(True, alpha=0.3)
-ax3.tick_params(axis='x', rotation=45)
 ax3.axhline(0, color='black', linewidth=0.8)
 
 # 4. Cumulative Product (with smaller values)
-ax4 = fig.add_subplot(gs[1, 1])
+ax4 = fig.add_subplot(gs[1, 1], sharex=ax1)
 # Use percentage returns for cumprod
 returns = np.random.randn(50) * 0.02  # 2% daily volatility
-df_returns = pd.DataFrame({
-    'date': dates,
-    'return': returns,
-    'cumulative_return': (1 + pd.Series(returns)).cumprod()
-})
+cum_ret = np.cumprod(1.0 + returns)
 
-ax4.plot(df_returns['date'], df_returns['cumulative_return'],
+ax4.plot(dates, cum_ret,
         linewidth=2, color='#FF9800', marker='o', markersize=3)
-ax4.fill_between(df_returns['date'], 1, df_returns['cumulative_return'],
+ax4.fill_between(dates, 1, cum_ret,
                 alpha=0.3, color='#FF9800')
 ax4.set_title('cumprod() - Cumulative Product (Investment Growth)', fontweight='bold')
 ax4.set_xlabel('Date')
@@ -104,28 +101,23 @@ ax4.set_ylabel('Cumulative Return (multiplier)')
 ax4.grid(True, alpha=0.3)
 ax4.axhline(1, color='black', linewidth=0.8, linestyle='--', label='Break-even')
 ax4.legend()
-ax4.tick_params(axis='x', rotation=45)
 
 # Add final return annotation
-final_return = df_returns['cumulative_return'].iloc[-1]
+final_return = cum_ret[-1]
 ax4.annotate(f'Final: {final_return:.2f}x',
-            xy=(df_returns['date'].iloc[-1], final_return),
+            xy=(dates[-1], final_return),
             xytext=(-50, 20), textcoords='offset points',
             bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.7),
             arrowprops=dict(arrowstyle='->', color='black'))
 
 # 5. Comparison of all cumulative operations
-ax5 = fig.add_subplot(gs[2, 0])
-# Normalize for comparison (manual min-max scaling)
-def normalize(series):
-    return (series - series.min()) / (series.max() - series.min())
-
-df_normalized = pd.DataFrame({
-    'daily_change': normalize(df['daily_change']),
-    'cumsum': normalize(df['cumsum']),
-    'cummax': normalize(df['cummax']),
-    'cummin': normalize(df['cummin'])
-})
+ax5 = fig.add_subplot(gs[2, 0], sharex=ax1)
+# Normalize for comparison (manual min-max scaling), one row per series
+norm_cols = ['daily_change', 'cumsum', 'cummax', 'cummin']
+arr = df[norm_cols].to_numpy(dtype=float).T
+arr_min = arr.min(axis=1, keepdims=True)
+normed = (arr - arr_min) / np.ptp(arr, axis=1, keepdims=True)
+df_normalized = dict(zip(norm_cols, normed))
 
 ax5.plot(df['date'], df_normalized['daily_change'], label='Original',
         alpha=0.5, linewidth=1, color='gray')
@@ -141,7 +133,11 @@ ax5.set_xlabel('Date')
 ax5.set_ylabel('Normalized Value [0, 1]')
 ax5.legend()
 ax5.grid(True, alpha=0.3)
-ax5.tick_params(axis='x', rotation=45)
+
+# The date axes share one locator and formatter, but tick label rotation is not
+# shared, so each axis still needs its own rotation call
+for ax in (ax1, ax2, ax3, ax4, ax5):
+    ax.tick_params(axis='x', rotation=45)
 
 # 6. Summary table
 ax6 = fig.add_subplot(gs[2, 1])
@@ -173,21 +169,21 @@ table.auto_set_font_size(False)
 table.set_fontsize(9)
 table.scale(1, 3)
 
-# Style the header
-for i in range(3):
-    table[(0, i)].set_facecolor('#2196F3')
-    table[(0, i)].set_text_props(weight='bold', color='white')
-
-# Alternate row colors
-for i in range(len(summary_data)-1):
-    for j in range(3):
-        if i % 2 == 0:
-            table[(i+1, j)].set_facecolor('#E3F2FD')
-        if j == 0:
-            table[(i+1, j)].set_text_props(weight='bold')
+# Style the header, alternate row colors and the first column in a single
+# pass over the cells
+for (row, col), cell in table.get_celld().items():
+    if row == 0:
+        cell.set_facecolor('#2196F3')
+        cell.set_text_props(weight='bold', color='white')
+        continue
+    if row % 2 == 1:
+        cell.set_facecolor('#E3F2FD')
+    if col == 0:
+        cell.set_text_props(weight='bold')
 
 ax6.set_title('Cumulative Operations - Summary', fontweight='bold', pad=20, fontsize=12)
 
 plt.savefig('/Users/jawad/Documents/work/dsai/5m-data-1.8-eda-basic/illustrations/07_cumulative_operations.png',
             dpi=300, bbox_inches='tight')
 print("Saved: 07_cumulative_operations.png")
+plt.close(fig)
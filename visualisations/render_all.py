@@ -0,0 +1,26 @@
+"""
+Render all illustration scripts in parallel
+Each script runs in a fresh worker process, so the figures are generated concurrently
+and no style settings or open figures leak from one script into the next
+"""
+import runpy
+from multiprocessing import Pool
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+
+def run(script):
+    """Execute an illustration script as if it were run from the command line"""
+    runpy.run_path(str(script), run_name='__main__')
+
+
+def main():
+    scripts = sorted(SCRIPT_DIR.glob('[0-9][0-9]_*.py'))
+    # One task per worker, so every script starts from a clean interpreter
+    with Pool(maxtasksperchild=1) as pool:
+        pool.map(run, scripts, chunksize=1)
+
+
+if __name__ == '__main__':
+    main()